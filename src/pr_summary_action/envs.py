@@ -0,0 +1,44 @@
+"""Typed environment variable accessors for PR Summary Action.
+
+Each supported variable is declared once in ``environment_variables``
+together with its parser, and resolved lazily through the module-level
+``__getattr__`` (PEP 562). Access variables as attributes::
+
+    from pr_summary_action import envs
+
+    envs.MAX_TOKENS  # -> int, parsed from os.environ
+
+Values are read from ``os.environ`` on every access so tests that patch
+the environment always see the current value.
+"""
+
+import os
+from typing import Any, Callable, Dict
+
+environment_variables: Dict[str, Callable[[], Any]] = {
+    "GITHUB_TOKEN": lambda: os.environ.get("GITHUB_TOKEN", ""),
+    "GITHUB_REPOSITORY": lambda: os.environ.get("GITHUB_REPOSITORY", ""),
+    "GITHUB_EVENT_PATH": lambda: os.environ.get("GITHUB_EVENT_PATH", ""),
+    "OPENAI_API_KEY": lambda: os.environ.get("OPENAI_API_KEY", ""),
+    "MODEL": lambda: os.environ.get("MODEL", "gpt-3.5-turbo"),
+    "MAX_TOKENS": lambda: int(os.environ.get("MAX_TOKENS", "300")),
+    "TEMPERATURE": lambda: float(os.environ.get("TEMPERATURE", "0.7")),
+    "SLACK_WEBHOOK": lambda: os.environ.get("SLACK_WEBHOOK", ""),
+    "SLACK_CHANNEL": lambda: os.environ.get("SLACK_CHANNEL"),
+    "MAX_DIFF_LENGTH": lambda: int(os.environ.get("MAX_DIFF_LENGTH", "3000")),
+    "ENABLE_DEBUG": lambda: os.environ.get("ENABLE_DEBUG", "true").lower() == "true",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve an environment variable through its registered parser."""
+    try:
+        return environment_variables[name]()
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+
+def __dir__() -> list:
+    return list(environment_variables)
@@ -0,0 +1,125 @@
+"""Shared pytest fixtures for the PR summary test suite."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.pr_summary_action import summarize
+from tests.test_fixtures import (
+    MockGitHubEvents,
+    OPENAI_FIXTURES,
+    make_http_response,
+    make_openai_response,
+)
+
+# Session-scoped event fixtures hand out the shared read-only views from
+# test_fixtures; the dict behind each is built once per session. Tests
+# that mutate an event should request the function-scoped *_mut variant,
+# which deep-copies on every use.
+
+
+@pytest.fixture(scope="session")
+def event_files(tmp_path_factory):
+    """Per-scenario GitHub event files, written once per session.
+
+    Maps scenario name to a path holding the cached event JSON; tests
+    that feed an unmodified event to main() reuse these instead of
+    serializing and writing their own copy.
+    """
+    events_dir = tmp_path_factory.mktemp("events")
+    files = {}
+    for variant in MockGitHubEvents.VARIANTS:
+        path = events_dir / f"{variant}.json"
+        path.write_bytes(getattr(MockGitHubEvents, f"{variant}_pr_event_bytes")())
+        files[variant] = path
+    return files
+
+
+@pytest.fixture
+def mocked_externals():
+    """Patch the summarize module's external calls for a workflow test.
+
+    Yields a namespace with the three patched entry points (get, post,
+    openai) plus the pre-built response objects, so tests assign
+    ``.get_response.text`` / ``.openai_message.content`` instead of
+    re-entering three patch blocks and rebuilding the Mock graph each
+    time. Not autouse: unit tests patch these targets individually.
+    """
+    with (
+        patch.object(summarize._SESSION, "get") as mock_get,
+        patch.object(summarize._SESSION, "post") as mock_post,
+        patch("src.pr_summary_action.summarize.OpenAI") as mock_openai,
+    ):
+        get_response = make_http_response()
+        mock_get.return_value = get_response
+
+        client = mock_openai.return_value
+        completion = make_openai_response()
+        openai_message = completion.choices[0].message
+        client.chat.completions.create.return_value = completion
+
+        post_response = make_http_response()
+        mock_post.return_value = post_response
+
+        yield SimpleNamespace(
+            get=mock_get,
+            post=mock_post,
+            openai=mock_openai,
+            client=client,
+            get_response=get_response,
+            post_response=post_response,
+            openai_message=openai_message,
+        )
+
+
+@pytest.fixture
+def pr_event(request):
+    """Scenario event resolved via indirect parametrization.
+
+    Tests opt in with
+    ``@pytest.mark.parametrize("pr_event", MockGitHubEvents.VARIANTS, indirect=True)``.
+    """
+    return MockGitHubEvents.event(request.param)
+
+
+@pytest.fixture
+def openai_response(request):
+    """Canned OpenAI response body resolved via indirect parametrization.
+
+    Keys cover the four scenarios plus the "invalid_json" and "empty"
+    error paths.
+    """
+    return OPENAI_FIXTURES[request.param]
+
+
+@pytest.fixture(scope="session")
+def feature_pr_event():
+    """Shared read-only feature PR event."""
+    return MockGitHubEvents.feature_pr_event()
+
+
+@pytest.fixture(scope="session")
+def bugfix_pr_event():
+    """Shared read-only bugfix PR event."""
+    return MockGitHubEvents.bugfix_pr_event()
+
+
+@pytest.fixture(scope="session")
+def docs_pr_event():
+    """Shared read-only documentation PR event."""
+    return MockGitHubEvents.docs_pr_event()
+
+
+@pytest.fixture(scope="session")
+def refactor_pr_event():
+    """Shared read-only refactoring PR event."""
+    return MockGitHubEvents.refactor_pr_event()
+
+
+@pytest.fixture
+def feature_pr_event_mut():
+    """Fresh mutable deep copy of the feature PR event."""
+    return MockGitHubEvents.feature_pr_event_copy()
@@ -5,9 +5,20 @@ Tests for the Config class.
 import os
 import pytest
 from unittest.mock import patch
+from pydantic import ValidationError
 
 from src.pr_summary_action.config import Config
 
+# Canonical valid configuration, perturbed one field at a time in the
+# validation tests below.
+VALID_KWARGS = dict(
+    github_token="test_token",
+    github_repository="test/repo",
+    github_event_path="/path/to/event.json",
+    openai_api_key="sk-test-key",
+    slack_webhook="https://hooks.slack.com/services/test",
+)
+
 
 class TestConfig:
     """Test Config class functionality."""
@@ -65,8 +76,9 @@ class TestConfig:
         assert config.enable_debugging is True
 
     def test_config_validation_success(self):
-        """Test successful configuration validation."""
-        config = Config(
+        """Test that a fully valid configuration constructs cleanly."""
+        # Should not raise any exception; validation runs at construction
+        Config(
             github_token="test_token",
             github_repository="test/repo",
             github_event_path="/path/to/event.json",
@@ -80,92 +92,24 @@ class TestConfig:
             enable_debugging=True,
         )
 
-        # Should not raise any exception
-        config.validate()
-
-    def test_config_validation_missing_required_field(self):
-        """Test validation fails for missing required fields."""
-        config = Config(
-            github_token="",  # Missing required field
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://hooks.slack.com/services/test",
-        )
-
-        with pytest.raises(
-            ValueError, match="Required configuration field 'github_token' is missing"
-        ):
-            config.validate()
-
-    def test_config_validation_invalid_model(self):
-        """Test validation fails for invalid OpenAI model."""
-        config = Config(
-            github_token="test_token",
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://hooks.slack.com/services/test",
-            openai_model="invalid-model",
-        )
-
-        with pytest.raises(ValueError, match="Invalid OpenAI model: invalid-model"):
-            config.validate()
-
-    def test_config_validation_invalid_slack_webhook(self):
-        """Test validation fails for invalid Slack webhook."""
-        config = Config(
-            github_token="test_token",
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://invalid-webhook.com",
-        )
-
-        with pytest.raises(ValueError, match="Invalid Slack webhook URL format"):
-            config.validate()
-
-    def test_config_validation_invalid_max_tokens(self):
-        """Test validation fails for invalid max_tokens."""
-        config = Config(
-            github_token="test_token",
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://hooks.slack.com/services/test",
-            max_tokens=10,  # Too low
-        )
-
-        with pytest.raises(ValueError, match="max_tokens must be between 50 and 4000"):
-            config.validate()
-
-    def test_config_validation_invalid_temperature(self):
-        """Test validation fails for invalid temperature."""
-        config = Config(
-            github_token="test_token",
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://hooks.slack.com/services/test",
-            temperature=3.0,  # Too high
-        )
-
-        with pytest.raises(ValueError, match="temperature must be between 0.0 and 2.0"):
-            config.validate()
-
-    def test_config_validation_invalid_max_diff_length(self):
-        """Test validation fails for invalid max_diff_length."""
-        config = Config(
-            github_token="test_token",
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://hooks.slack.com/services/test",
-            max_diff_length=50,  # Too low
-        )
-
-        with pytest.raises(ValueError, match="max_diff_length must be at least 100"):
-            config.validate()
+    @pytest.mark.parametrize(
+        "override, msg",
+        [
+            ({"github_token": ""}, r"github_token\s+String should have at least 1"),
+            ({"openai_model": "invalid-model"}, r"openai_model\s+Input should be"),
+            (
+                {"slack_webhook": "https://invalid-webhook.com"},
+                "Invalid Slack webhook URL format",
+            ),
+            ({"max_tokens": 10}, r"greater than or equal to 50"),
+            ({"temperature": 3.0}, r"less than or equal to 2"),
+            ({"max_diff_length": 50}, r"greater than or equal to 100"),
+        ],
+    )
+    def test_config_validation_invalid(self, override, msg):
+        """Test construction fails when a single field is perturbed."""
+        with pytest.raises(ValidationError, match=msg):
+            Config(**{**VALID_KWARGS, **override})
 
     def test_config_to_dict_masks_secrets(self):
         """Test that to_dict masks sensitive information."""
@@ -187,7 +131,9 @@ class TestConfig:
 
     def test_config_to_dict_empty_secrets(self):
         """Test that to_dict handles empty secrets."""
-        config = Config(
+        # model_construct skips validation so the empty-secret rendering
+        # can be exercised
+        config = Config.model_construct(
             github_token="",
             github_repository="test/repo",
             github_event_path="/path/to/event.json",
@@ -253,37 +199,23 @@ class TestConfig:
         valid_models = ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"]
 
         for model in valid_models:
-            config = Config(
-                github_token="test_token",
-                github_repository="test/repo",
-                github_event_path="/path/to/event.json",
-                openai_api_key="sk-test-key",
-                slack_webhook="https://hooks.slack.com/services/test",
-                openai_model=model,
-            )
-
             # Should not raise any exception
-            config.validate()
+            Config(**VALID_KWARGS, openai_model=model)
 
     def test_config_boundary_values(self):
         """Test configuration with boundary values."""
-        config = Config(
-            github_token="test_token",
-            github_repository="test/repo",
-            github_event_path="/path/to/event.json",
-            openai_api_key="sk-test-key",
-            slack_webhook="https://hooks.slack.com/services/test",
+        # Should not raise any exception at either end of the ranges
+        Config(
+            **VALID_KWARGS,
             max_tokens=50,  # Minimum
             temperature=0.0,  # Minimum
             max_diff_length=100,  # Minimum
         )
-
-        # Should not raise any exception
-        config.validate()
-
-        config.max_tokens = 4000  # Maximum
-        config.temperature = 2.0  # Maximum
-        config.validate()
+        Config(
+            **VALID_KWARGS,
+            max_tokens=4000,  # Maximum
+            temperature=2.0,  # Maximum
+        )
 
     def test_config_integration_with_real_env(self):
         """Test config integration with realistic environment setup."""
@@ -303,7 +235,6 @@ class TestConfig:
 
         with patch.dict(os.environ, env_vars):
             config = Config.from_env()
-            config.validate()
 
             # Verify realistic values are parsed correctly
             assert config.github_token.startswith("ghp_")
@@ -9,9 +9,41 @@ import pytest
 import requests
 from dotenv import load_dotenv
 
+# Skip the whole module at collection time if the openai package is missing
+openai = pytest.importorskip("openai")
+OpenAI = openai.OpenAI
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Templates for the full-simulation test, built once at module scope so the
+# test body only substitutes values instead of re-assembling the strings.
+_PROMPT_TEMPLATE = """
+Analyze this PR and create summaries:
+
+Title: {title}
+Description: {body}
+Diff: Added login/logout functionality with proper session management
+
+Return JSON:
+{{"technical": "2-3 sentence technical summary", "marketing": "1-2 sentence user benefit"}}
+"""
+
+_SLACK_SUMMARY_TEMPLATE = (
+    "🚀 *Test PR Summary*\n\n"
+    "**Technical:** {technical}\n**Marketing:** {marketing}"
+)
+
+_SLACK_CONTEXT_BLOCK = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": "🔧 This is a test of the full PR summary workflow",
+        }
+    ],
+}
+
 
 class TestCredentials:
     """Test class for credential validation."""
@@ -41,8 +73,6 @@ class TestCredentials:
         if not api_key:
             pytest.skip("OpenAI API key not available")
 
-        from openai import OpenAI
-
         client = OpenAI(api_key=api_key)
 
         try:
@@ -91,16 +121,10 @@ class TestCredentials:
             ],
         }
 
-        try:
-            response = requests.post(webhook_url, json=test_message, timeout=30)
-            response.raise_for_status()
-
-            assert response.status_code == 200, (
-                f"Slack webhook returned status {response.status_code}"
-            )
-
-        except Exception as e:
-            pytest.fail(f"Slack webhook test failed: {str(e)}")
+        # raise_for_status covers any non-2xx; let failures propagate so
+        # pytest reports the full traceback
+        response = requests.post(webhook_url, json=test_message, timeout=30)
+        response.raise_for_status()
 
     @pytest.mark.integration
     def test_full_pr_summary_simulation(self):
@@ -111,8 +135,6 @@ class TestCredentials:
         if not api_key or not webhook_url:
             pytest.skip("Missing required credentials for full simulation")
 
-        from openai import OpenAI
-
         client = OpenAI(api_key=api_key)
 
         mock_pr_data = {
@@ -123,63 +145,40 @@ class TestCredentials:
         }
 
         # Test OpenAI summary generation
-        prompt = f"""
-        Analyze this PR and create summaries:
-
-        Title: {mock_pr_data["title"]}
-        Description: {mock_pr_data["body"]}
-        Diff: Added login/logout functionality with proper session management
+        prompt = _PROMPT_TEMPLATE.format(
+            title=mock_pr_data["title"], body=mock_pr_data["body"]
+        )
 
-        Return JSON:
-        {{"technical": "2-3 sentence technical summary", "marketing": "1-2 sentence user benefit"}}
-        """
+        response = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=200,
+        )
 
         try:
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-            )
-
-            try:
-                summaries = json.loads(response.choices[0].message.content)
-                assert "technical" in summaries, "Technical summary not found"
-                assert "marketing" in summaries, "Marketing summary not found"
-            except json.JSONDecodeError:
-                summaries = {
-                    "technical": "Test technical summary",
-                    "marketing": "Test marketing summary",
-                }
-
-            # Test Slack posting
-            slack_message = {
-                "text": "🧪 PR Summary Action - Full Test",
-                "blocks": [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"🚀 *Test PR Summary*\n\n**Technical:** {summaries['technical']}\n**Marketing:** {summaries['marketing']}",
-                        },
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": "🔧 This is a test of the full PR summary workflow",
-                            }
-                        ],
-                    },
-                ],
+            summaries = json.loads(response.choices[0].message.content)
+            assert "technical" in summaries, "Technical summary not found"
+            assert "marketing" in summaries, "Marketing summary not found"
+        except json.JSONDecodeError:
+            summaries = {
+                "technical": "Test technical summary",
+                "marketing": "Test marketing summary",
             }
 
-            response = requests.post(webhook_url, json=slack_message, timeout=30)
-            response.raise_for_status()
-
-            assert response.status_code == 200, (
-                f"Slack posting failed with status {response.status_code}"
-            )
+        # Test Slack posting; raise_for_status covers any non-2xx response
+        slack_message = {
+            "text": "🧪 PR Summary Action - Full Test",
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": _SLACK_SUMMARY_TEMPLATE.format(**summaries),
+                    },
+                },
+                _SLACK_CONTEXT_BLOCK,
+            ],
+        }
 
-        except Exception as e:
-            pytest.fail(f"Full PR summary simulation failed: {str(e)}")
+        response = requests.post(webhook_url, json=slack_message, timeout=30)
+        response.raise_for_status()
@@ -0,0 +1,43 @@
+"""Test fixtures for PR summary tests.
+
+The fixture data lives in lazily-imported submodules (PEP 562): a test
+run that never touches a fixture family never materializes it.
+"""
+
+from __future__ import annotations
+
+__all__ = (
+    "make_http_response",
+    "make_openai_response",
+    "MockGitHubEvents",
+    "MockPRDiffs",
+    "MockOpenAIResponses",
+    "PR_EVENT_FIXTURES",
+    "PR_DIFF_FIXTURES",
+    "OPENAI_FIXTURES",
+)
+
+_SUBMODULES = {
+    "make_http_response": "_factories",
+    "make_openai_response": "_factories",
+    "MockGitHubEvents": "_events",
+    "PR_EVENT_FIXTURES": "_events",
+    "MockPRDiffs": "_diffs",
+    "PR_DIFF_FIXTURES": "_diffs",
+    "MockOpenAIResponses": "_openai",
+    "OPENAI_FIXTURES": "_openai",
+}
+
+
+def __getattr__(name):
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+
+    return getattr(importlib.import_module(f".{submodule}", __name__), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -0,0 +1,75 @@
+"""Mock PR diff payloads, read lazily from tests/fixtures."""
+
+from __future__ import annotations
+
+import functools
+import pathlib
+
+_FIXTURES_DIR = pathlib.Path(__file__).resolve().parent.parent / "fixtures"
+
+
+class MockPRDiffs:
+    """Mock PR diff data for testing.
+
+    The diff bodies live in ``tests/fixtures/*.diff`` and are read lazily;
+    ``lru_cache`` hands out the same string object on repeated calls.
+    """
+
+    @staticmethod
+    @functools.cache
+    def feature_diff() -> str:
+        """Mock diff for a feature PR."""
+        return (_FIXTURES_DIR / "feature.diff").read_text()
+
+    @staticmethod
+    @functools.cache
+    def feature_diff_bytes() -> bytes:
+        """UTF-8 bytes of the feature PR diff."""
+        return (_FIXTURES_DIR / "feature.diff").read_bytes()
+
+    @staticmethod
+    @functools.cache
+    def bugfix_diff() -> str:
+        """Mock diff for a bugfix PR."""
+        return (_FIXTURES_DIR / "bugfix.diff").read_text()
+
+    @staticmethod
+    @functools.cache
+    def bugfix_diff_bytes() -> bytes:
+        """UTF-8 bytes of the bugfix PR diff."""
+        return (_FIXTURES_DIR / "bugfix.diff").read_bytes()
+
+    @staticmethod
+    @functools.cache
+    def docs_diff() -> str:
+        """Mock diff for a documentation PR."""
+        return (_FIXTURES_DIR / "docs.diff").read_text()
+
+    @staticmethod
+    @functools.cache
+    def docs_diff_bytes() -> bytes:
+        """UTF-8 bytes of the documentation PR diff."""
+        return (_FIXTURES_DIR / "docs.diff").read_bytes()
+
+    @staticmethod
+    @functools.cache
+    def refactor_diff() -> str:
+        """Mock diff for a refactoring PR."""
+        return (_FIXTURES_DIR / "refactor.diff").read_text()
+
+    @staticmethod
+    @functools.cache
+    def refactor_diff_bytes() -> bytes:
+        """UTF-8 bytes of the refactoring PR diff."""
+        return (_FIXTURES_DIR / "refactor.diff").read_bytes()
+
+
+# Scenario dispatch table for parametrized tests: one dict lookup per
+# scenario instead of an accessor call per parameter.
+# Diffs stay lazy behind their cached readers.
+PR_DIFF_FIXTURES = {
+    "feature": MockPRDiffs.feature_diff,
+    "bugfix": MockPRDiffs.bugfix_diff,
+    "docs": MockPRDiffs.docs_diff,
+    "refactor": MockPRDiffs.refactor_diff,
+}
@@ -0,0 +1,312 @@
+"""Mock GitHub event payloads, composed once at import."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import sys
+import types
+from typing import Any
+
+# Shared sub-structures: every event references the same user/repo/label
+# objects instead of allocating its own copy of each. The repo name and
+# "User" type recur across several dicts; interned constants make each a
+# single heap object with identity-based equality.
+_REPO_NAME = sys.intern("test-repo")
+_REPO_FULL = sys.intern("test-org/test-repo")
+_USER_TYPE = sys.intern("User")
+
+_REPO_REF = {"name": _REPO_NAME, "full_name": _REPO_FULL}
+_USER_TEST = {
+    "login": "test-user",
+    "id": 12345,
+    "type": _USER_TYPE,
+    "name": "Test User",
+    "email": "test@example.com",
+}
+_USER_MAINTAINER = {
+    "login": "maintainer",
+    "id": 67890,
+    "type": _USER_TYPE,
+    "name": "Maintainer",
+    "email": "maintainer@example.com",
+}
+_USER_DEVELOPER1 = {
+    "login": "developer1",
+    "id": 12345,
+    "type": _USER_TYPE,
+    "name": "John Developer",
+    "email": "john@example.com",
+}
+_USER_DEVELOPER2 = {
+    "login": "developer2",
+    "id": 12346,
+    "type": _USER_TYPE,
+    "name": "Alice Developer",
+    "email": "alice@example.com",
+}
+_USER_TECHWRITER1 = {
+    "login": "techwriter1",
+    "id": 12347,
+    "type": _USER_TYPE,
+    "name": "Bob Writer",
+    "email": "bob@example.com",
+}
+_LABEL_FEATURE = {"name": "feature", "color": "0e8a16"}
+_LABEL_SECURITY = {"name": "security", "color": "d93f0b"}
+_LABEL_BUG = {"name": "bug", "color": "d73a4a"}
+_LABEL_MEMORY = {"name": "memory", "color": "f9d0c4"}
+_LABEL_DOCUMENTATION = {"name": "documentation", "color": "0075ca"}
+_LABEL_REFACTOR = {"name": "refactor", "color": "fbca04"}
+_LABEL_ARCHITECTURE = {"name": "architecture", "color": "d4c5f9"}
+
+# Label/assignee collections are tuples: immutable, shared by reference,
+# and serialized to JSON arrays just like lists.
+_NO_ITEMS: tuple = ()
+_LABELS_FEATURE = (_LABEL_FEATURE, _LABEL_SECURITY)
+_LABELS_BUGFIX = (_LABEL_BUG, _LABEL_MEMORY)
+_LABELS_DOCS = (_LABEL_DOCUMENTATION,)
+_LABELS_REFACTOR = (_LABEL_REFACTOR, _LABEL_ARCHITECTURE)
+
+
+# Events are composed once at import time by structural sharing: a common
+# shell plus a base pull_request template, with each scenario spreading
+# its overrides on top. The nested repository/sender/base dicts are a
+# single allocation shared by reference across all five events.
+#
+# The events deliberately stay JSON-shaped dicts rather than dataclass
+# instances: the code under test and json.dumps both consume them as
+# mappings, exactly as GitHub delivers them.
+_REPOSITORY = {
+    "id": 987654321,
+    "name": _REPO_NAME,
+    "full_name": _REPO_FULL,
+    "owner": {"login": "test-org", "id": 11111, "type": "Organization"},
+}
+_SENDER = {"login": "maintainer", "id": 67890, "type": _USER_TYPE}
+_BASE_BRANCH = {"sha": "def456ghi789", "ref": "main", "repo": _REPO_REF}
+
+_EVENT_SHELL = {
+    "action": "closed",
+    "number": 42,
+    "repository": _REPOSITORY,
+    "sender": _SENDER,
+}
+
+_BASE_PULL_REQUEST = {
+    "id": 123456789,
+    "number": 42,
+    "state": "closed",
+    "locked": False,
+    "title": "Test PR",
+    "body": "This is a test PR description",
+    "created_at": "2023-11-15T10:30:00Z",
+    "updated_at": "2023-11-15T11:00:00Z",
+    "closed_at": "2023-11-15T11:00:00Z",
+    "merged_at": "2023-11-15T11:00:00Z",
+    "merged": True,
+    "mergeable": True,
+    "head": {"sha": "abc123def456", "ref": "feature-branch", "repo": _REPO_REF},
+    "base": _BASE_BRANCH,
+    "user": _USER_TEST,
+    "merged_by": _USER_MAINTAINER,
+    "assignees": _NO_ITEMS,
+    "requested_reviewers": _NO_ITEMS,
+    "labels": _NO_ITEMS,
+    "milestone": None,
+    "draft": False,
+    "html_url": "https://github.com/test-org/test-repo/pull/42",
+}
+
+_BASE_PR_EVENT = {**_EVENT_SHELL, "pull_request": _BASE_PULL_REQUEST}
+
+# Per-scenario pull_request overrides, allocated once.
+_FEATURE_OVERLAY = {
+    "title": "Add user authentication with OAuth2",
+    "body": "## Summary\nThis PR adds OAuth2 authentication support using Google as the provider.\n\n## Changes\n- Added OAuth2Provider class for handling authentication\n- Implemented login/callback routes\n- Added session management\n- Updated authentication flow\n\n## Testing\n- Added unit tests for OAuth2Provider\n- Tested login flow manually\n- Verified callback handling\n\n## Security Notes\n- Uses HTTPS for all OAuth2 flows\n- Implements CSRF protection with state parameter\n- Session cookies are httpOnly and secure",
+    "head": {"sha": "feature123", "ref": "feature/oauth2-auth", "repo": _REPO_REF},
+    "labels": _LABELS_FEATURE,
+    "user": _USER_DEVELOPER1,
+}
+
+_BUGFIX_OVERLAY = {
+    "title": "Fix memory leak in session cleanup",
+    "body": "## Bug Description\nSession cleanup wasn't properly releasing memory, causing gradual memory leaks.\n\n## Root Cause\nThe cleanup timer wasn't being canceled properly, and callback references weren't being cleared.\n\n## Solution\n- Added proper timer cleanup\n- Implemented callback cleanup in session destruction\n- Added periodic cleanup timer management\n\n## Reproduction\n1. Create multiple sessions\n2. Let them expire\n3. Memory usage increases over time\n\n## Testing\n- Added unit tests for session cleanup\n- Verified memory usage remains stable\n- Tested timer management",
+    "head": {
+        "sha": "bugfix456",
+        "ref": "fix/session-memory-leak",
+        "repo": _REPO_REF,
+    },
+    "labels": _LABELS_BUGFIX,
+    "user": _USER_DEVELOPER2,
+}
+
+_DOCS_OVERLAY = {
+    "title": "Update authentication API documentation",
+    "body": "## Documentation Updates\nUpdated the authentication API documentation to reflect the new OAuth2 implementation.\n\n## Changes\n- Added OAuth2 endpoint documentation\n- Updated authentication flow diagrams\n- Added security considerations section\n- Updated error handling documentation\n\n## Review Notes\n- All examples have been tested\n- Links have been verified\n- Screenshots updated",
+    "head": {"sha": "docs789", "ref": "docs/update-auth-api", "repo": _REPO_REF},
+    "labels": _LABELS_DOCS,
+    "user": _USER_TECHWRITER1,
+}
+
+_REFACTOR_OVERLAY = {
+    "title": "Refactor authentication service architecture",
+    "body": "## Refactoring Overview\nRefactored the authentication service to use dependency injection and improve testability.\n\n## Changes\n- Introduced IAuthService interface\n- Added dependency injection for user repository and session manager\n- Simplified authentication flow\n- Improved error handling with custom exceptions\n\n## Benefits\n- Better testability with mocked dependencies\n- Cleaner separation of concerns\n- More maintainable code structure\n- Easier to extend with new authentication methods\n\n## Breaking Changes\nNone - all public APIs remain the same.",
+    "head": {
+        "sha": "refactor101",
+        "ref": "refactor/auth-service-di",
+        "repo": _REPO_REF,
+    },
+    "labels": _LABELS_REFACTOR,
+}
+
+_FEATURE_PR_EVENT = {
+    **_EVENT_SHELL,
+    "pull_request": {**_BASE_PULL_REQUEST, **_FEATURE_OVERLAY},
+}
+
+_BUGFIX_PR_EVENT = {
+    **_EVENT_SHELL,
+    "pull_request": {**_BASE_PULL_REQUEST, **_BUGFIX_OVERLAY},
+}
+
+_DOCS_PR_EVENT = {
+    **_EVENT_SHELL,
+    "pull_request": {**_BASE_PULL_REQUEST, **_DOCS_OVERLAY},
+}
+
+_REFACTOR_PR_EVENT = {
+    **_EVENT_SHELL,
+    "pull_request": {**_BASE_PULL_REQUEST, **_REFACTOR_OVERLAY},
+}
+
+# JSON bytes for each event, serialized once; tests that only need to
+# write an event file can use the *_bytes accessors and skip json.dumps.
+_FEATURE_PR_EVENT_BYTES = json.dumps(_FEATURE_PR_EVENT).encode()
+_BUGFIX_PR_EVENT_BYTES = json.dumps(_BUGFIX_PR_EVENT).encode()
+_DOCS_PR_EVENT_BYTES = json.dumps(_DOCS_PR_EVENT).encode()
+_REFACTOR_PR_EVENT_BYTES = json.dumps(_REFACTOR_PR_EVENT).encode()
+
+# Pickle blobs for the mutable-copy accessors: pickle.loads on a cached
+# blob clones these nested dicts several times faster than copy.deepcopy,
+# which pays Python-level memo and reduction dispatch per node.
+_BASE_PR_EVENT_PICKLED = pickle.dumps(_BASE_PR_EVENT, protocol=pickle.HIGHEST_PROTOCOL)
+_FEATURE_PR_EVENT_PICKLED = pickle.dumps(
+    _FEATURE_PR_EVENT, protocol=pickle.HIGHEST_PROTOCOL
+)
+_BUGFIX_PR_EVENT_PICKLED = pickle.dumps(
+    _BUGFIX_PR_EVENT, protocol=pickle.HIGHEST_PROTOCOL
+)
+_DOCS_PR_EVENT_PICKLED = pickle.dumps(_DOCS_PR_EVENT, protocol=pickle.HIGHEST_PROTOCOL)
+_REFACTOR_PR_EVENT_PICKLED = pickle.dumps(
+    _REFACTOR_PR_EVENT, protocol=pickle.HIGHEST_PROTOCOL
+)
+
+# Read-only views handed out by the shared accessors; attempted top-level
+# mutation raises TypeError instead of silently corrupting other tests.
+_BASE_PR_EVENT_RO = types.MappingProxyType(_BASE_PR_EVENT)
+_FEATURE_PR_EVENT_RO = types.MappingProxyType(_FEATURE_PR_EVENT)
+_BUGFIX_PR_EVENT_RO = types.MappingProxyType(_BUGFIX_PR_EVENT)
+_DOCS_PR_EVENT_RO = types.MappingProxyType(_DOCS_PR_EVENT)
+_REFACTOR_PR_EVENT_RO = types.MappingProxyType(_REFACTOR_PR_EVENT)
+
+
+class MockGitHubEvents:
+    """Mock GitHub event data for testing.
+
+    The plain accessors return shared event dicts and must be treated as
+    read-only; tests that need to mutate an event should use the ``*_copy``
+    variants, which clone from a cached pickle blob.
+
+    Scenario-parametrized tests can iterate ``VARIANTS`` and resolve each
+    name through ``event()``; the named accessors below remain as thin
+    per-scenario entry points.
+    """
+
+    VARIANTS = ("feature", "bugfix", "docs", "refactor")
+
+    @staticmethod
+    def event(variant: str) -> types.MappingProxyType:
+        """Shared read-only event for the named scenario."""
+        return PR_EVENT_FIXTURES[variant]
+
+    @staticmethod
+    def base_pr_event() -> types.MappingProxyType:
+        """Base PR event structure (shared, read-only view)."""
+        return _BASE_PR_EVENT_RO
+
+    @staticmethod
+    def get_base_pr_event() -> dict[str, Any]:
+        """Base PR event structure (fresh, mutable copy)."""
+        return pickle.loads(_BASE_PR_EVENT_PICKLED)
+
+    @staticmethod
+    def feature_pr_event() -> dict[str, Any]:
+        """Mock GitHub event for a feature PR (shared, read-only view)."""
+        return _FEATURE_PR_EVENT_RO
+
+    @staticmethod
+    def feature_pr_event_bytes() -> bytes:
+        """Cached JSON serialization of the feature PR event."""
+        return _FEATURE_PR_EVENT_BYTES
+
+    @staticmethod
+    def feature_pr_event_copy() -> dict[str, Any]:
+        """Mutable deep copy of the feature PR event."""
+        return pickle.loads(_FEATURE_PR_EVENT_PICKLED)
+
+    @staticmethod
+    def bugfix_pr_event() -> dict[str, Any]:
+        """Mock GitHub event for a bugfix PR (shared, read-only view)."""
+        return _BUGFIX_PR_EVENT_RO
+
+    @staticmethod
+    def bugfix_pr_event_bytes() -> bytes:
+        """Cached JSON serialization of the bugfix PR event."""
+        return _BUGFIX_PR_EVENT_BYTES
+
+    @staticmethod
+    def bugfix_pr_event_copy() -> dict[str, Any]:
+        """Mutable deep copy of the bugfix PR event."""
+        return pickle.loads(_BUGFIX_PR_EVENT_PICKLED)
+
+    @staticmethod
+    def docs_pr_event() -> dict[str, Any]:
+        """Mock GitHub event for a documentation PR (shared, read-only view)."""
+        return _DOCS_PR_EVENT_RO
+
+    @staticmethod
+    def docs_pr_event_bytes() -> bytes:
+        """Cached JSON serialization of the docs PR event."""
+        return _DOCS_PR_EVENT_BYTES
+
+    @staticmethod
+    def docs_pr_event_copy() -> dict[str, Any]:
+        """Mutable deep copy of the documentation PR event."""
+        return pickle.loads(_DOCS_PR_EVENT_PICKLED)
+
+    @staticmethod
+    def refactor_pr_event() -> dict[str, Any]:
+        """Mock GitHub event for a refactoring PR (shared, read-only view)."""
+        return _REFACTOR_PR_EVENT_RO
+
+    @staticmethod
+    def refactor_pr_event_bytes() -> bytes:
+        """Cached JSON serialization of the refactor PR event."""
+        return _REFACTOR_PR_EVENT_BYTES
+
+    @staticmethod
+    def refactor_pr_event_copy() -> dict[str, Any]:
+        """Mutable deep copy of the refactoring PR event."""
+        return pickle.loads(_REFACTOR_PR_EVENT_PICKLED)
+
+
+# Scenario dispatch table for parametrized tests: one dict lookup per
+# scenario instead of an accessor call per parameter.
+# Events are the shared read-only views.
+PR_EVENT_FIXTURES = {
+    "feature": _FEATURE_PR_EVENT_RO,
+    "bugfix": _BUGFIX_PR_EVENT_RO,
+    "docs": _DOCS_PR_EVENT_RO,
+    "refactor": _REFACTOR_PR_EVENT_RO,
+}
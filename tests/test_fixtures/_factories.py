@@ -0,0 +1,38 @@
+"""Factories for the standard mock response graphs.
+
+Tests only read attributes off these objects, so they are built from
+SimpleNamespace rather than Mock wherever possible; a Mock is kept only
+for ``raise_for_status`` so tests can inject a ``side_effect``.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+
+def make_openai_response(content: str = "") -> SimpleNamespace:
+    """Build a chat-completion response with a single message."""
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def make_http_response(text: str = "", status_code: int = 200) -> SimpleNamespace:
+    """Build a requests-style response object.
+
+    ``iter_content`` re-reads ``text`` on each call, so tests that assign
+    a new body after construction stream the updated value.
+    """
+    response = SimpleNamespace(
+        text=text,
+        status_code=status_code,
+        raise_for_status=Mock(return_value=None),
+    )
+
+    def iter_content(chunk_size: int = 65536):
+        data = response.text.encode()
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    response.iter_content = iter_content
+    return response
@@ -0,0 +1,126 @@
+"""Mock OpenAI response payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import Final
+
+# Canonical summary payloads; the JSON strings handed to the code under
+# test are serialized once here, and tests that want the parsed form can
+# use the *_obj accessors and skip json.loads entirely.
+_FEATURE_SUMMARY_OBJ = {
+    "technical": "Added OAuth2 authentication using Google provider with proper session management and security measures",
+    "marketing": "Enhanced security with modern OAuth2 authentication - users can now log in securely using their Google accounts",
+}
+_BUGFIX_SUMMARY_OBJ = {
+    "technical": "Fixed memory leak in session cleanup by properly canceling timers and clearing callback references",
+    "marketing": "Improved application performance by fixing a memory leak that could cause the system to slow down over time",
+}
+_DOCS_SUMMARY_OBJ = {
+    "technical": "Updated authentication API documentation to reflect OAuth2 implementation with comprehensive security guidelines",
+    "marketing": "Improved developer experience with updated and comprehensive authentication documentation",
+}
+_REFACTOR_SUMMARY_OBJ = {
+    "technical": "Refactored authentication service to use dependency injection pattern for better testability and maintainability",
+    "marketing": "Enhanced code quality and maintainability through improved architecture - making the system more reliable and easier to extend",
+}
+
+_FEATURE_SUMMARY_JSON = json.dumps(_FEATURE_SUMMARY_OBJ, separators=(",", ":"))
+_BUGFIX_SUMMARY_JSON = json.dumps(_BUGFIX_SUMMARY_OBJ, separators=(",", ":"))
+_DOCS_SUMMARY_JSON = json.dumps(_DOCS_SUMMARY_OBJ, separators=(",", ":"))
+_REFACTOR_SUMMARY_JSON = json.dumps(_REFACTOR_SUMMARY_OBJ, separators=(",", ":"))
+
+_FEATURE_SUMMARY_BYTES = _FEATURE_SUMMARY_JSON.encode()
+_BUGFIX_SUMMARY_BYTES = _BUGFIX_SUMMARY_JSON.encode()
+_DOCS_SUMMARY_BYTES = _DOCS_SUMMARY_JSON.encode()
+_REFACTOR_SUMMARY_BYTES = _REFACTOR_SUMMARY_JSON.encode()
+
+# Error-path responses as Final constants: every call returns the same
+# string object.
+_INVALID_JSON: Final[str] = "This is not valid JSON"
+_EMPTY: Final[str] = ""
+
+# Scenario dispatch table for parametrized tests: one dict lookup per
+# scenario instead of an accessor call per parameter.
+OPENAI_FIXTURES = {
+    "feature": _FEATURE_SUMMARY_JSON,
+    "bugfix": _BUGFIX_SUMMARY_JSON,
+    "docs": _DOCS_SUMMARY_JSON,
+    "refactor": _REFACTOR_SUMMARY_JSON,
+    "invalid_json": _INVALID_JSON,
+    "empty": _EMPTY,
+}
+
+
+class MockOpenAIResponses:
+    """Mock OpenAI API responses for testing."""
+
+    @staticmethod
+    def feature_summary() -> str:
+        """Mock OpenAI response for feature PR."""
+        return _FEATURE_SUMMARY_JSON
+
+    @staticmethod
+    def feature_summary_bytes() -> bytes:
+        """UTF-8 bytes of the feature PR response."""
+        return _FEATURE_SUMMARY_BYTES
+
+    @staticmethod
+    def feature_summary_obj() -> dict[str, str]:
+        """Parsed form of the feature PR response."""
+        return _FEATURE_SUMMARY_OBJ
+
+    @staticmethod
+    def bugfix_summary() -> str:
+        """Mock OpenAI response for bugfix PR."""
+        return _BUGFIX_SUMMARY_JSON
+
+    @staticmethod
+    def bugfix_summary_bytes() -> bytes:
+        """UTF-8 bytes of the bugfix PR response."""
+        return _BUGFIX_SUMMARY_BYTES
+
+    @staticmethod
+    def bugfix_summary_obj() -> dict[str, str]:
+        """Parsed form of the bugfix PR response."""
+        return _BUGFIX_SUMMARY_OBJ
+
+    @staticmethod
+    def docs_summary() -> str:
+        """Mock OpenAI response for documentation PR."""
+        return _DOCS_SUMMARY_JSON
+
+    @staticmethod
+    def docs_summary_bytes() -> bytes:
+        """UTF-8 bytes of the documentation PR response."""
+        return _DOCS_SUMMARY_BYTES
+
+    @staticmethod
+    def docs_summary_obj() -> dict[str, str]:
+        """Parsed form of the documentation PR response."""
+        return _DOCS_SUMMARY_OBJ
+
+    @staticmethod
+    def refactor_summary() -> str:
+        """Mock OpenAI response for refactoring PR."""
+        return _REFACTOR_SUMMARY_JSON
+
+    @staticmethod
+    def refactor_summary_bytes() -> bytes:
+        """UTF-8 bytes of the refactoring PR response."""
+        return _REFACTOR_SUMMARY_BYTES
+
+    @staticmethod
+    def refactor_summary_obj() -> dict[str, str]:
+        """Parsed form of the refactoring PR response."""
+        return _REFACTOR_SUMMARY_OBJ
+
+    @staticmethod
+    def invalid_json_response() -> str:
+        """Mock invalid JSON response for error testing."""
+        return _INVALID_JSON
+
+    @staticmethod
+    def empty_response() -> str:
+        """Mock empty response for error testing."""
+        return _EMPTY